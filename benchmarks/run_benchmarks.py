@@ -0,0 +1,428 @@
+import argparse
+import gc
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_SIZES = [10_000, 100_000]
+LARGE_SIZE = 1_000_000
+DEFAULT_REPEAT = 5
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+ARROW_SAMPLE_INTERVAL = 0.001
+
+UNITS = ['minute', 'hour', 'day', 'week', 'month']
+COMPANIES = ['TechCorp', 'Acme', 'Globex', 'Initech', 'Umbrella']
+
+
+@dataclass
+class Measurement:
+    seconds: float
+    peak_mb: float
+
+
+def generate_urls(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    urls = []
+    for index in range(count):
+        slug = f"User-{index:07d}-{rng.getrandbits(32):08x}"
+        if index % 3 == 0:
+            urls.append(f"https://www.linkedin.com/in/{slug}/?miniProfileUrn=urn%3Ali%3A{index}")
+        elif index % 3 == 1:
+            urls.append(f"/in/{slug}")
+        else:
+            urls.append(f"https://uk.linkedin.com/in/{slug}#about")
+    return urls
+
+
+def generate_records(count: int, seed: int = 0) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    records = []
+    for index, url in enumerate(generate_urls(count, seed)):
+        amount = rng.randint(1, 11)
+        records.append({
+            'profile_name': f"Person {index}",
+            'profile_url': url,
+            'invitation_date': f"Sent {amount} {rng.choice(UNITS)}s ago",
+            'invited_to': f"Invited to follow {rng.choice(COMPANIES)}",
+        })
+    return records
+
+
+def time_action(action: Callable[[], None]) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+class ArrowPeakSampler:
+    """Track peak Arrow memory pool usage, which tracemalloc does not see."""
+
+    def __init__(self, interval: float = ARROW_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = 0
+        self._allocated = None
+        self._start = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        self.peak = max(self.peak, self._allocated() - self._start)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return self
+        self._allocated = pa.total_allocated_bytes
+        self._start = self._allocated()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+
+
+def peak_memory_mb(action: Callable[[], None]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with ArrowPeakSampler() as arrow:
+            action()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak + arrow.peak) / (1024 * 1024)
+
+
+def run_once(name: str, size: int, probe: Callable[[Callable[[], None]], float]) -> float:
+    with tempfile.TemporaryDirectory(prefix="linkscraper-bench-") as tmp:
+        action = BENCHMARKS[name](size, Path(tmp))
+        return probe(action)
+
+
+def bench_dedup_add_url(size: int, workdir: Path) -> Callable[[], None]:
+    from linkscraper.utils.deduplicator import Deduplicator
+
+    urls = generate_urls(size)
+    deduplicator = Deduplicator(state_file=workdir / "state.json")
+    return lambda: deduplicator.add_urls(urls)
+
+
+def bench_dedup_save_state(size: int, workdir: Path) -> Callable[[], None]:
+    from linkscraper.utils.deduplicator import Deduplicator
+
+    deduplicator = Deduplicator(state_file=workdir / "state.json")
+    deduplicator.add_urls(generate_urls(size))
+    return deduplicator.save_state
+
+
+def bench_dedup_load_state(size: int, workdir: Path) -> Callable[[], None]:
+    from linkscraper.utils.deduplicator import Deduplicator
+
+    state_file = workdir / "state.json"
+    writer = Deduplicator(state_file=state_file)
+    writer.add_urls(generate_urls(size))
+    writer.save_state()
+    return Deduplicator(state_file=state_file).load_state
+
+
+def bench_canonicalize_urls(size: int, workdir: Path) -> Callable[[], None]:
+    import pandas as pd
+
+    from linkscraper.utils.postprocess import canonicalize_profile_urls
+
+    urls = pd.Series(generate_urls(size))
+    return lambda: canonicalize_profile_urls(urls)
+
+
+def bench_postprocess_frame(size: int, workdir: Path) -> Callable[[], None]:
+    import pandas as pd
+
+    from linkscraper.utils.postprocess import postprocess_frame
+
+    df = pd.DataFrame(generate_records(size))
+    run_timestamp = datetime(2024, 1, 15, 10, 30)
+    return lambda: postprocess_frame(df, run_timestamp)
+
+
+def bench_log_unparsed_item(size: int, workdir: Path) -> Callable[[], None]:
+    from linkscraper.utils.logger import ScraperLogger
+
+    logger = ScraperLogger(log_dir=str(workdir / "logs"))
+    html = "<li class=\"invitation-card\">" + "<span>broken</span>" * 100 + "</li>"
+
+    def action():
+        for index in range(size):
+            logger.log_unparsed_item(html[:500], f"Profile link not found ({index})", full_html=html)
+
+    return action
+
+
+def bench_save_results(size: int, workdir: Path) -> Callable[[], None]:
+    from linkscraper.config import ScraperConfig
+    from linkscraper.scrapers.linkedin_invitations import InvitationEntry, LinkedInInvitationsScraper
+
+    config = ScraperConfig(
+        output_csv=workdir / "output.csv",
+        output_xlsx=workdir / "output.xlsx",
+        resume_state_file=workdir / "state.json",
+        logs_dir=workdir / "logs",
+    )
+    scraper = LinkedInInvitationsScraper(config)
+    for handler in list(scraper.logger.main_logger.handlers):
+        if not isinstance(handler, logging.FileHandler):
+            scraper.logger.main_logger.removeHandler(handler)
+    scraper.entries = [InvitationEntry(**record) for record in generate_records(size)]
+    return scraper._save_results
+
+
+SIZE_CAPS = {
+    'log_unparsed_item': 10_000,
+    'save_results': 100_000,
+}
+
+BENCHMARKS: Dict[str, Callable[[int, Path], Callable[[], None]]] = {
+    'dedup_add_url': bench_dedup_add_url,
+    'dedup_save_state': bench_dedup_save_state,
+    'dedup_load_state': bench_dedup_load_state,
+    'canonicalize_urls': bench_canonicalize_urls,
+    'postprocess_frame': bench_postprocess_frame,
+    'log_unparsed_item': bench_log_unparsed_item,
+    'save_results': bench_save_results,
+}
+
+
+def run_benchmarks(
+    sizes: List[int],
+    names: List[str],
+    repeat: int = DEFAULT_REPEAT,
+    apply_size_caps: bool = True,
+) -> Tuple[Dict[str, Measurement], List[str]]:
+    results = {}
+    skipped = []
+    for name in names:
+        for size in sizes:
+            key = f"{name}[{size}]"
+            cap = SIZE_CAPS.get(name)
+            if apply_size_caps and cap is not None and size > cap:
+                print(f"{key:<32} skipped (above cap of {cap}; use --no-size-caps)", flush=True)
+                skipped.append(key)
+                continue
+
+            times = [run_once(name, size, time_action) for _ in range(max(1, repeat))]
+            measurement = Measurement(
+                seconds=statistics.median(times),
+                peak_mb=run_once(name, size, peak_memory_mb),
+            )
+            results[key] = measurement
+            print(
+                f"{key:<32} {measurement.seconds:>10.3f}s median of {len(times)} "
+                f"{measurement.peak_mb:>10.1f} MB peak",
+                flush=True,
+            )
+    return results, skipped
+
+
+def compare_with_baseline(
+    results: Dict[str, Measurement],
+    baseline: Dict[str, Dict[str, float]],
+    time_threshold: float,
+    memory_threshold: float,
+    time_slack: float = 0.01,
+    memory_slack_mb: float = 1.0,
+) -> List[str]:
+    regressions = []
+    for key, measurement in results.items():
+        reference = baseline.get(key)
+        if not reference:
+            continue
+        time_limit = reference['seconds'] * (1 + time_threshold) + time_slack
+        if measurement.seconds > time_limit:
+            regressions.append(
+                f"{key}: {measurement.seconds:.3f}s exceeds baseline {reference['seconds']:.3f}s "
+                f"(+{time_threshold:.0%} allowed)"
+            )
+        memory_limit = reference['peak_mb'] * (1 + memory_threshold) + memory_slack_mb
+        if measurement.peak_mb > memory_limit:
+            regressions.append(
+                f"{key}: {measurement.peak_mb:.1f} MB exceeds baseline {reference['peak_mb']:.1f} MB "
+                f"(+{memory_threshold:.0%} allowed)"
+            )
+    return regressions
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, float]]:
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file).get('results', {})
+
+
+def save_results(path: Path, results: Dict[str, Measurement], merge_into: Dict[str, Dict[str, float]]):
+    merged = dict(merge_into)
+    for key, measurement in results.items():
+        merged[key] = {
+            'seconds': round(measurement.seconds, 6),
+            'peak_mb': round(measurement.peak_mb, 3),
+        }
+    payload = {
+        'metadata': {
+            'updated_at': datetime.utcnow().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'results': dict(sorted(merged.items())),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline microbenchmarks for linkscraper components")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Record counts to benchmark"
+    )
+    parser.add_argument(
+        "--large",
+        action="store_true",
+        help=f"Also benchmark {LARGE_SIZE} records"
+    )
+    parser.add_argument(
+        "--no-size-caps",
+        action="store_true",
+        help="Run I/O-bound benchmarks at sizes above their caps"
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=sorted(BENCHMARKS),
+        default=None,
+        help="Run only the selected benchmarks"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help="Timed repetitions per benchmark (median time is kept)"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=str(DEFAULT_BASELINE),
+        help="Path to baseline JSON file"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the measured results into the baseline file"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Write the measured results to this JSON file"
+    )
+    parser.add_argument(
+        "--time-threshold",
+        type=float,
+        default=0.25,
+        help="Allowed relative slowdown before failing (0.25 = 25%%)"
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=0.25,
+        help="Allowed relative peak memory growth before failing"
+    )
+    parser.add_argument(
+        "--time-slack",
+        type=float,
+        default=0.01,
+        help="Absolute time tolerance in seconds added to the threshold"
+    )
+    parser.add_argument(
+        "--memory-slack-mb",
+        type=float,
+        default=1.0,
+        help="Absolute peak memory tolerance in MB added to the threshold"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    names = args.only or list(BENCHMARKS)
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path)
+
+    sizes = list(args.sizes)
+    if args.large and LARGE_SIZE not in sizes:
+        sizes.append(LARGE_SIZE)
+
+    results, skipped = run_benchmarks(
+        sizes,
+        names,
+        repeat=args.repeat,
+        apply_size_caps=not args.no_size_caps,
+    )
+
+    if args.output:
+        save_results(Path(args.output), results, {})
+
+    if args.update_baseline:
+        save_results(baseline_path, results, baseline)
+        print(f"Baseline updated: {baseline_path}")
+        return 0
+
+    if not baseline:
+        print(f"No baseline found at {baseline_path}; run with --update-baseline to create one")
+        return 0
+
+    regressions = compare_with_baseline(
+        results,
+        baseline,
+        args.time_threshold,
+        args.memory_threshold,
+        time_slack=args.time_slack,
+        memory_slack_mb=args.memory_slack_mb,
+    )
+    if skipped:
+        print(f"Not compared ({len(skipped)} skipped by size caps): {', '.join(skipped)}")
+    if regressions:
+        print("Performance regressions detected:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    compared = sum(1 for key in results if key in baseline)
+    print(f"No regressions against baseline ({compared} compared, {len(skipped)} skipped)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ class ScraperConfig:
     output_csv: Path = Path("output.csv")
     output_xlsx: Path = Path("output.xlsx")
     resume_state_file: Path = Path("data/state.json")
+    snapshot_file: Path = Path("data/snapshot.csv")
     logs_dir: Path = Path("logs")
     headless: bool = False
     user_data_dir: Optional[Path] = None
@@ -20,10 +21,17 @@ class ScraperConfig:
     progress_interval: int = 5
     max_scrolls_without_new_content: int = 5
     scroll_batch_size: int = 3
+    wait_timeout_initial_ms: int = 8000
+    wait_timeout_min_ms: int = 1500
+    wait_timeout_max_ms: int = 15000
+    list_request_keywords: List[str] = field(default_factory=lambda: ["invitation"])
+    pending_request_timeout: float = 30.0
     output_encoding: str = "utf-8"
     max_resume_entries: Optional[int] = 5000
     max_html_snippet_length: int = 500
     user_agents: Optional[List[str]] = field(default=None)
+    metrics_port: Optional[int] = None
+    metrics_host: str = "127.0.0.1"
 
     def __post_init__(self):
         if isinstance(self.output_csv, str):
@@ -32,6 +40,8 @@ class ScraperConfig:
             self.output_xlsx = Path(self.output_xlsx)
         if isinstance(self.resume_state_file, str):
             self.resume_state_file = Path(self.resume_state_file)
+        if isinstance(self.snapshot_file, str):
+            self.snapshot_file = Path(self.snapshot_file)
         if isinstance(self.logs_dir, str):
             self.logs_dir = Path(self.logs_dir)
 
@@ -57,3 +67,7 @@ class ScraperConfig:
     @property
     def unparsed_log_file(self) -> Path:
         return self.logs_dir / "unparsed_items.log"
+
+    @property
+    def diff_csv(self) -> Path:
+        return self.output_csv.with_name(f"{self.output_csv.stem}_diff.csv")
@@ -1,8 +1,9 @@
 import argparse
+import sqlite3
+import sys
 from pathlib import Path
 
 from linkscraper.config import ScraperConfig
-from linkscraper.scrapers.linkedin_invitations import LinkedInInvitationsScraper
 
 
 def parse_args() -> argparse.Namespace:
@@ -42,12 +43,94 @@ def parse_args() -> argparse.Namespace:
         default="https://www.linkedin.com/mynetwork/invitation-manager/sent/ORGANIZATION/",
         help="Override default target URL"
     )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve live Prometheus metrics on this local port while scraping"
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    merge_parser = subparsers.add_parser(
+        "merge",
+        help="Merge and deduplicate historical CSV/Parquet outputs with bounded memory"
+    )
+    merge_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Input CSV/Parquet files, in priority order (first seen row wins)"
+    )
+    merge_parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        required=True,
+        help="Path to merged output file (.csv or .parquet)"
+    )
+    merge_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=100_000,
+        help="Number of rows read per chunk"
+    )
+    merge_parser.add_argument(
+        "--index-path",
+        type=str,
+        default=None,
+        help="Path to on-disk key index (temporary file by default; must not exist yet)"
+    )
+    merge_parser.add_argument(
+        "--key",
+        type=str,
+        default="profile_url",
+        help="Column used to detect duplicates (default: profile_url)"
+    )
+    merge_parser.add_argument(
+        "--encoding",
+        type=str,
+        default="utf-8",
+        help="Encoding of CSV inputs and output"
+    )
+    merge_parser.add_argument(
+        "--logs-dir",
+        type=str,
+        default="logs",
+        help="Directory for merge logs"
+    )
     return parser.parse_args()
 
 
-def main():
-    args = parse_args()
-    
+def run_merge(args: argparse.Namespace):
+    from linkscraper.utils.logger import ScraperLogger
+    from linkscraper.utils.merge import merge_outputs
+
+    logger = ScraperLogger(log_dir=args.logs_dir)
+    try:
+        stats = merge_outputs(
+            inputs=[Path(path) for path in args.inputs],
+            output=Path(args.output),
+            chunk_size=args.chunk_size,
+            encoding=args.encoding,
+            index_path=Path(args.index_path) if args.index_path else None,
+            logger=logger,
+            key=args.key,
+        )
+    except (ValueError, OSError, sqlite3.Error) as exc:
+        logger.log_error(f"Merge failed: {exc}")
+        sys.exit(1)
+    logger.log_progress(
+        f"Merge completed: {stats.files} files, {stats.rows_read} rows read, "
+        f"{stats.rows_written} unique rows written, {stats.duplicates} duplicates, "
+        f"{stats.missing_urls} rows without profile URL"
+    )
+    logger.log_progress(
+        f"Merge duration: {stats.duration:.2f}s ({stats.rows_per_second:.0f} rows/s)"
+    )
+
+
+def run_scraper(args: argparse.Namespace):
+    from linkscraper.scrapers.linkedin_invitations import LinkedInInvitationsScraper
+
     config = ScraperConfig(
         target_url=args.target_url,
         output_csv=Path(args.output_csv),
@@ -55,11 +138,21 @@ def main():
         resume_state_file=Path(args.resume_state),
         headless=args.headless,
         user_data_dir=Path(args.user_data_dir) if args.user_data_dir else None,
+        metrics_port=args.metrics_port,
     )
-    
+
     scraper = LinkedInInvitationsScraper(config)
     scraper.run()
 
 
+def main():
+    args = parse_args()
+
+    if args.command == "merge":
+        run_merge(args)
+    else:
+        run_scraper(args)
+
+
 if __name__ == "__main__":
     main()
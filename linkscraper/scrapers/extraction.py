@@ -0,0 +1,178 @@
+import json
+from dataclasses import dataclass, field, make_dataclass
+from typing import Any, Dict, List, Optional
+
+REGISTRY_NAME = "__linkscraperExtractors"
+TRANSFORMS = ("trim", "absolute_url", "strip_query", "collapse_whitespace")
+
+EXTRACT_BATCH_SCRIPT = (
+    "({ name, start, end }) => window." + REGISTRY_NAME + "[name](start, end)"
+)
+EXTRACTOR_READY_SCRIPT = (
+    "name => Boolean(window." + REGISTRY_NAME + " && window." + REGISTRY_NAME + "[name])"
+)
+
+_EXTRACTOR_TEMPLATE = """
+(() => {
+  const spec = %(spec)s;
+  const registry = window.%(registry)s = window.%(registry)s || {};
+  const transforms = {
+    trim: value => value.trim(),
+    collapse_whitespace: value => value.replace(/\\s+/g, ' ').trim(),
+    absolute_url: value => value.startsWith('/') ? (spec.baseUrl || location.origin) + value : value,
+    strip_query: value => value.split('?')[0],
+  };
+
+  const readValue = (element, field) => {
+    const raw = field.attribute ? element.getAttribute(field.attribute) : element.innerText;
+    return raw ? raw.trim() : '';
+  };
+
+  const keywordLine = (card, keyword) => {
+    const needle = keyword.toLowerCase();
+    for (const line of (card.innerText || '').split('\\n')) {
+      const cleaned = line.trim();
+      if (cleaned.toLowerCase().includes(needle)) {
+        return cleaned;
+      }
+    }
+    return '';
+  };
+
+  const extractField = (card, field) => {
+    let value = '';
+    for (const selector of field.selectors) {
+      const element = card.querySelector(selector);
+      if (!element) {
+        continue;
+      }
+      value = readValue(element, field);
+      if (value) {
+        break;
+      }
+    }
+    if (!value && field.keyword) {
+      value = keywordLine(card, field.keyword);
+    }
+    for (const name of field.transforms) {
+      if (value) {
+        value = transforms[name](value);
+      }
+    }
+    return value || null;
+  };
+
+  registry[spec.name] = (start, end) => {
+    const cards = document.querySelectorAll(spec.cardSelector);
+    const total = cards.length;
+    const safeStart = Math.min(start || 0, total);
+    const safeEnd = Math.min(end == null ? total : end, total);
+    const items = [];
+
+    for (let index = safeStart; index < safeEnd; index++) {
+      const card = cards[index];
+      try {
+        const values = {};
+        let error = null;
+        for (const field of spec.fields) {
+          const value = extractField(card, field);
+          if (value === null && field.required) {
+            error = field.missingMessage;
+            break;
+          }
+          values[field.name] = value === null ? field.default : value;
+        }
+        items.push(error ? { error, html: card.innerHTML.slice(0, spec.maxHtmlLength) } : { values });
+      } catch (exc) {
+        items.push({
+          error: `Unhandled parsing error: ${exc}`,
+          html: (card.innerHTML || '').slice(0, spec.maxHtmlLength),
+        });
+      }
+    }
+
+    return { total, items };
+  };
+})();
+"""
+
+
+@dataclass
+class FieldSpec:
+    name: str
+    selectors: List[str] = field(default_factory=list)
+    attribute: Optional[str] = None
+    keyword: Optional[str] = None
+    transforms: List[str] = field(default_factory=lambda: ["trim"])
+    required: bool = False
+    default: str = ""
+    missing_message: Optional[str] = None
+
+    def __post_init__(self):
+        unknown = [name for name in self.transforms if name not in TRANSFORMS]
+        if unknown:
+            raise ValueError(f"Unknown transforms for field '{self.name}': {', '.join(unknown)}")
+        if self.missing_message is None:
+            self.missing_message = f"{self.name} not found"
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "selectors": list(self.selectors),
+            "attribute": self.attribute,
+            "keyword": self.keyword,
+            "transforms": list(self.transforms),
+            "required": self.required,
+            "default": self.default,
+            "missingMessage": self.missing_message,
+        }
+
+
+@dataclass
+class ExtractionSpec:
+    name: str
+    card_selectors: List[str]
+    fields: List[FieldSpec]
+    entry_type: Optional[type] = None
+    key_field: str = "profile_url"
+    base_url: Optional[str] = None
+    max_html_length: int = 2000
+    _script: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.key_field not in self.columns:
+            raise ValueError(f"Key field '{self.key_field}' is not defined in spec '{self.name}'")
+        if self.entry_type is None:
+            self.entry_type = make_dataclass(
+                f"{self.name.title().replace('_', '')}Entry",
+                [(spec.name, str) for spec in self.fields],
+            )
+
+    @property
+    def columns(self) -> List[str]:
+        return [spec.name for spec in self.fields]
+
+    @property
+    def card_selector(self) -> str:
+        return ", ".join(self.card_selectors)
+
+    def compile(self) -> str:
+        if self._script is None:
+            payload = {
+                "name": self.name,
+                "cardSelector": self.card_selector,
+                "fields": [spec.to_json() for spec in self.fields],
+                "baseUrl": self.base_url,
+                "maxHtmlLength": self.max_html_length,
+            }
+            self._script = _EXTRACTOR_TEMPLATE % {
+                "spec": json.dumps(payload, ensure_ascii=False),
+                "registry": REGISTRY_NAME,
+            }
+        return self._script
+
+    def entry_key(self, entry) -> str:
+        return getattr(entry, self.key_field)
+
+    def build_entry(self, values: Dict[str, Any]):
+        return self.entry_type(**{spec.name: values.get(spec.name, spec.default) for spec in self.fields})
@@ -1,14 +1,82 @@
+import json
 import time
 from dataclasses import dataclass, asdict
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from linkscraper.config import ScraperConfig
+from linkscraper.scrapers.extraction import (
+    EXTRACT_BATCH_SCRIPT,
+    EXTRACTOR_READY_SCRIPT,
+    ExtractionSpec,
+    FieldSpec,
+)
+from linkscraper.utils.adaptive_wait import AdaptiveTimeout
 from linkscraper.utils.browser_session import BrowserSession
 from linkscraper.utils.deduplicator import Deduplicator
 from linkscraper.utils.logger import ScraperLogger
+from linkscraper.utils.metrics import Metric, MetricsServer
+from linkscraper.utils.postprocess import (
+    RESOLVED_DATE_COLUMN,
+    canonicalize_profile_urls,
+    normalize_resolved_dates,
+    output_columns,
+    postprocess_frame,
+)
+from linkscraper.utils.snapshot_diff import diff_snapshots, write_snapshot
+
+
+_END_MARKER_FUNCTION = (
+    "({ cardSelector, containerSelector, endSelectors }) => {"
+    "  const card = document.querySelector(cardSelector);"
+    "  const container = (card && card.closest(containerSelector))"
+    "    || document.querySelector(containerSelector);"
+    "  if (!container) {"
+    "    return false;"
+    "  }"
+    "  const isVisible = element => {"
+    "    const style = window.getComputedStyle(element);"
+    "    const rect = element.getBoundingClientRect();"
+    "    return style.display !== 'none' && style.visibility !== 'hidden'"
+    "      && rect.width > 0 && rect.height > 0;"
+    "  };"
+    "  return endSelectors.some(selector =>"
+    "    Array.from(container.querySelectorAll(selector)).some(isVisible));"
+    "}"
+)
+
+_CARD_GROWTH_OBSERVER = """
+(() => {
+  const selector = %s;
+  let lastCount = 0;
+  let scheduled = false;
+  window.__linkscraperCardGrowthAt = null;
+  const check = () => {
+    scheduled = false;
+    const count = document.querySelectorAll(selector).length;
+    if (count > lastCount && window.__linkscraperCardGrowthAt === null) {
+      window.__linkscraperCardGrowthAt = Date.now();
+    }
+    lastCount = count;
+  };
+  const schedule = () => {
+    if (!scheduled) {
+      scheduled = true;
+      requestAnimationFrame(check);
+    }
+  };
+  const start = () => new MutationObserver(schedule).observe(
+    document.documentElement, { childList: true, subtree: true }
+  );
+  if (document.documentElement) {
+    start();
+  } else {
+    document.addEventListener('DOMContentLoaded', start);
+  }
+})();
+"""
 
 
 @dataclass
@@ -26,7 +94,6 @@ class LinkedInInvitationsScraper:
         "li[data-chameleon-result-urn]",
         "li.scaffold-finite-scroll__content li",
     ]
-    CARD_SELECTOR = ", ".join(CARD_SELECTORS)
 
     NAME_SELECTORS = [
         '.invitation-card__name',
@@ -47,6 +114,49 @@ class LinkedInInvitationsScraper:
         '[class*="subtitle"]',
     ]
 
+    LIST_CONTAINER_SELECTORS = [
+        '.scaffold-finite-scroll',
+        'section.artdeco-card',
+        'main',
+    ]
+
+    END_OF_LIST_SELECTORS = [
+        '.scaffold-finite-scroll__end',
+        '[data-test-end-of-list]',
+        '.artdeco-empty-state',
+    ]
+
+    PROFILE_LINK_SELECTORS = [
+        'a[href*="/in/"]',
+        'a.invitation-card__link',
+        'a[data-control-name*="profile"]',
+    ]
+
+    EXTRACTION_SPEC = ExtractionSpec(
+        name="sent_invitations",
+        card_selectors=CARD_SELECTORS,
+        fields=[
+            FieldSpec(
+                'profile_url',
+                selectors=PROFILE_LINK_SELECTORS,
+                attribute='href',
+                transforms=['trim', 'absolute_url', 'strip_query'],
+                required=True,
+                missing_message="Profile link not found",
+            ),
+            FieldSpec(
+                'profile_name',
+                selectors=NAME_SELECTORS + PROFILE_LINK_SELECTORS,
+                required=True,
+                missing_message="Profile name not found",
+            ),
+            FieldSpec('invitation_date', selectors=DATE_SELECTORS, keyword='Sent'),
+            FieldSpec('invited_to', selectors=INVITED_TO_SELECTORS, keyword='Invited to follow'),
+        ],
+        entry_type=InvitationEntry,
+        base_url="https://www.linkedin.com",
+    )
+
     def __init__(self, config: ScraperConfig):
         self.config = config
         self.logger = ScraperLogger(log_dir=str(config.logs_dir))
@@ -63,14 +173,32 @@ class LinkedInInvitationsScraper:
             state_file=config.resume_state_file,
             max_entries=config.max_resume_entries,
         )
+        self.output_columns = output_columns(self.EXTRACTION_SPEC.columns)
         self.entries: List[InvitationEntry] = []
+        self.run_entries: List[InvitationEntry] = []
         self.total_cards_seen = 0
         self.duplicates_found = 0
         self.processed_dom_cards = 0
+        self.wait_timeouts = 0
+        self.wait_timeout = AdaptiveTimeout(
+            initial_ms=config.wait_timeout_initial_ms,
+            min_ms=config.wait_timeout_min_ms,
+            max_ms=config.wait_timeout_max_ms,
+        )
+        self.pending_list_requests: Dict[Any, float] = {}
+        self.last_scroll_height: Optional[int] = None
+        self.batch_started: Optional[float] = None
+        self.list_request_started: Optional[float] = None
+        self.run_started_at: Optional[float] = None
+        self.last_new_card_at: Optional[float] = None
+        self.last_card_at: Optional[float] = None
+        self.metrics_server: Optional[MetricsServer] = None
 
     def run(self):
         try:
             self.logger.log_start(self.config.target_url)
+            self.run_started_at = time.monotonic()
+            self._start_metrics_server()
             self.deduplicator.load_state()
 
             if not self.config.user_data_dir:
@@ -80,6 +208,11 @@ class LinkedInInvitationsScraper:
 
             page = self.browser_session.start()
             self.logger.log_progress("Browser session started")
+            self._install_extractor(page)
+            page.add_init_script(
+                _CARD_GROWTH_OBSERVER % json.dumps(self.EXTRACTION_SPEC.card_selector)
+            )
+            self._track_list_requests(page)
 
             self.logger.log_progress(f"Navigating to {self.config.target_url}")
             page.goto(self.config.target_url, wait_until='networkidle', timeout=60000)
@@ -104,6 +237,7 @@ class LinkedInInvitationsScraper:
 
             output_path = self._save_results()
             self.deduplicator.save_state()
+            self._write_run_diff()
 
             self.logger.set_item_counts(
                 total=self.total_cards_seen,
@@ -119,6 +253,68 @@ class LinkedInInvitationsScraper:
         finally:
             self.browser_session.stop()
             self.logger.log_progress("Browser session closed")
+            if self.metrics_server:
+                self.metrics_server.stop()
+                self.metrics_server = None
+
+    def _start_metrics_server(self):
+        if self.config.metrics_port is None:
+            return
+        self.metrics_server = MetricsServer(
+            self.collect_metrics,
+            port=self.config.metrics_port,
+            host=self.config.metrics_host,
+        )
+        try:
+            port = self.metrics_server.start()
+        except OSError as exc:
+            self.logger.log_warning(f"Failed to start metrics endpoint: {exc}")
+            self.metrics_server = None
+            return
+        self.logger.log_progress(
+            f"Metrics endpoint: http://{self.config.metrics_host}:{port}/metrics"
+        )
+
+    def collect_metrics(self) -> List[Metric]:
+        now = time.monotonic()
+        elapsed = now - self.run_started_at if self.run_started_at is not None else None
+        cards_per_minute = (
+            self.total_cards_seen / (elapsed / 60) if elapsed else 0.0
+        )
+        last_new_card_age = self._seconds_since(self.last_new_card_at, now)
+        last_card_age = self._seconds_since(self.last_card_at, now)
+
+        return [
+            Metric("cards_seen_total", "counter", "Invitation cards parsed", self.total_cards_seen),
+            Metric("unique_entries", "gauge", "New unique invitations collected in this run", len(self.entries)),
+            Metric("duplicates_total", "counter", "Cards skipped as already collected", self.duplicates_found),
+            Metric("parsing_errors_total", "counter", "Cards that could not be parsed", self.logger.parsing_errors),
+            Metric("scrolls_total", "counter", "Scroll actions performed", self.logger.scroll_count),
+            Metric("processed_dom_cards", "gauge", "Invitation cards processed in the DOM", self.processed_dom_cards),
+            Metric("cards_per_minute", "gauge", "Average card parsing rate since start", cards_per_minute),
+            Metric(
+                "last_new_card_age_seconds",
+                "gauge",
+                "Seconds since the last new unique card (or since the run started)",
+                last_new_card_age,
+            ),
+            Metric(
+                "last_card_age_seconds",
+                "gauge",
+                "Seconds since the last parsed card, including duplicates (or since the run started)",
+                last_card_age,
+            ),
+            Metric("wait_timeouts_total", "counter", "Waits for new content that timed out", self.wait_timeouts),
+            Metric("wait_timeout_ms", "gauge", "Current adaptive wait timeout", self.wait_timeout.timeout_ms),
+            Metric("pending_list_requests", "gauge", "In-flight list requests", len(self.pending_list_requests)),
+            Metric("run_duration_seconds", "gauge", "Seconds since the run started", elapsed or 0.0),
+        ]
+
+    def _seconds_since(self, timestamp: Optional[float], now: float) -> Optional[float]:
+        reference = timestamp if timestamp is not None else self.run_started_at
+        if reference is None:
+            return None
+        return now - reference
 
     def _wait_for_page_load(self, page: Page):
         self.logger.log_debug("Waiting for page to load invitations...")
@@ -135,15 +331,17 @@ class LinkedInInvitationsScraper:
         consecutive_no_new = 0
 
         while consecutive_no_new < self.config.max_scrolls_without_new_content:
+            self._start_batch(page)
             for _ in range(self.config.scroll_batch_size):
                 self.browser_session.human_like_scroll(page, scroll_amount=500)
                 scroll_count += 1
                 self.logger.increment_scroll()
 
             total_dom_cards = self._wait_for_new_content(page, self.processed_dom_cards)
+            dom_grew = total_dom_cards > self.processed_dom_cards
             new_entries = 0
 
-            if total_dom_cards > self.processed_dom_cards:
+            if dom_grew:
                 new_entries = self._extract_invitations_from_page(
                     page,
                     self.processed_dom_cards,
@@ -151,17 +349,28 @@ class LinkedInInvitationsScraper:
                 )
                 self.processed_dom_cards = total_dom_cards
 
-            if new_entries == 0:
+            end_reason = self._detect_end_of_list(page)
+
+            if new_entries:
+                self.logger.log_progress(
+                    f"Progress: {len(self.entries)} unique invitations collected (+{new_entries})"
+                )
+
+            if dom_grew:
+                consecutive_no_new = 0
+            elif end_reason:
+                self.logger.log_progress(f"End of list detected: {end_reason}")
+                break
+            elif self._pending_list_request_count():
+                self.logger.log_debug(
+                    "No new items yet, list requests still pending; waiting for the server"
+                )
+            else:
                 consecutive_no_new += 1
                 self.logger.log_debug(
                     f"No new items found ({consecutive_no_new}/"
                     f"{self.config.max_scrolls_without_new_content})"
                 )
-            else:
-                consecutive_no_new = 0
-                self.logger.log_progress(
-                    f"Progress: {len(self.entries)} unique invitations collected (+{new_entries})"
-                )
 
             if self.entries and len(self.entries) % self.config.progress_interval == 0:
                 self.logger.log_progress(
@@ -171,134 +380,183 @@ class LinkedInInvitationsScraper:
         self.logger.log_progress(f"Finished scrolling after {scroll_count} scroll interactions")
         return scroll_count
 
+    def _end_marker_args(self) -> Dict[str, Any]:
+        return {
+            "cardSelector": self.EXTRACTION_SPEC.card_selector,
+            "containerSelector": ", ".join(self.LIST_CONTAINER_SELECTORS),
+            "endSelectors": self.END_OF_LIST_SELECTORS,
+        }
+
+    def _start_batch(self, page: Page):
+        self.batch_started = time.time()
+        self.list_request_started = None
+        try:
+            page.evaluate("() => { window.__linkscraperCardGrowthAt = null; }")
+        except Exception:
+            pass
+
     def _wait_for_new_content(self, page: Page, previous_dom_count: int) -> int:
+        wait_started = time.time()
+        timeout_ms = self.wait_timeout.timeout_ms
         try:
             page.wait_for_function(
-                "({ selectors, previous }) => selectors.reduce((total, selector) => "
-                "total + document.querySelectorAll(selector).length, 0) > previous",
-                {"selectors": self.CARD_SELECTORS, "previous": previous_dom_count},
-                timeout=8000,
+                "args => document.querySelectorAll(args.cardSelector).length > args.previous || "
+                f"({_END_MARKER_FUNCTION})(args)",
+                {**self._end_marker_args(), "previous": previous_dom_count},
+                timeout=timeout_ms,
             )
         except PlaywrightTimeoutError:
-            pass
-        return self._count_dom_cards(page)
+            self.wait_timeouts += 1
+            self.logger.log_debug(f"No new content within {timeout_ms} ms")
+            if self._pending_list_request_count():
+                self.wait_timeout.record_timeout(timeout_ms)
+            return self._count_dom_cards(page)
+
+        total_dom_cards = self._count_dom_cards(page)
+        if total_dom_cards > previous_dom_count:
+            self._record_card_latency(page, wait_started)
+        return total_dom_cards
+
+    def _record_card_latency(self, page: Page, wait_started: float):
+        anchor = self.list_request_started or wait_started
+        try:
+            grew_at_ms = page.evaluate("() => window.__linkscraperCardGrowthAt")
+        except Exception:
+            grew_at_ms = None
+        grew_at = grew_at_ms / 1000 if grew_at_ms else time.time()
+        if grew_at >= anchor:
+            self.wait_timeout.record((grew_at - anchor) * 1000)
+
+    def _detect_end_of_list(self, page: Page) -> Optional[str]:
+        try:
+            state = page.evaluate(
+                "args => {"
+                "  const root = document.scrollingElement || document.body;"
+                "  return {"
+                f"    marker: ({_END_MARKER_FUNCTION})(args),"
+                "    scrollHeight: root.scrollHeight,"
+                "    atBottom: window.innerHeight + window.scrollY >= root.scrollHeight - 50,"
+                "  };"
+                "}",
+                self._end_marker_args(),
+            )
+        except Exception:
+            return None
+
+        previous_height = self.last_scroll_height
+        self.last_scroll_height = state['scrollHeight']
+
+        if self._pending_list_request_count():
+            return None
+        if state['marker']:
+            return "end-of-list marker visible in the list"
+        if state['atBottom'] and previous_height == state['scrollHeight']:
+            return "scroll height unchanged at the bottom with no pending list requests"
+        return None
+
+    def _track_list_requests(self, page: Page):
+        keywords = [keyword.lower() for keyword in self.config.list_request_keywords]
+
+        def is_list_request(request) -> bool:
+            if request.resource_type not in ('xhr', 'fetch'):
+                return False
+            url = request.url.lower()
+            return any(keyword in url for keyword in keywords)
+
+        def on_request(request):
+            if is_list_request(request):
+                self.pending_list_requests[request] = time.monotonic()
+
+        def on_request_done(request):
+            if self.pending_list_requests.pop(request, None) is None:
+                return
+            started = self._request_start_time(request)
+            if started is None or self.batch_started is None or started < self.batch_started:
+                return
+            if self.list_request_started is None or started < self.list_request_started:
+                self.list_request_started = started
+
+        page.on("request", on_request)
+        page.on("requestfinished", on_request_done)
+        page.on("requestfailed", on_request_done)
+
+    @staticmethod
+    def _request_start_time(request) -> Optional[float]:
+        try:
+            start_ms = request.timing.get('startTime')
+        except Exception:
+            return None
+        if not start_ms or start_ms <= 0:
+            return None
+        return start_ms / 1000
+
+    def _pending_list_request_count(self) -> int:
+        cutoff = time.monotonic() - self.config.pending_request_timeout
+        for request, started in list(self.pending_list_requests.items()):
+            if started < cutoff:
+                self.pending_list_requests.pop(request, None)
+        return len(self.pending_list_requests)
 
     def _count_dom_cards(self, page: Page) -> int:
         try:
             return page.evaluate(
-                "selectors => selectors.reduce((total, selector) => "
-                "total + document.querySelectorAll(selector).length, 0)",
-                self.CARD_SELECTORS,
+                "selector => document.querySelectorAll(selector).length",
+                self.EXTRACTION_SPEC.card_selector,
             )
         except Exception:
             return 0
 
+    def _install_extractor(self, page: Page):
+        page.add_init_script(self.EXTRACTION_SPEC.compile())
+
+    def _ensure_extractor(self, page: Page):
+        if not page.evaluate(EXTRACTOR_READY_SCRIPT, self.EXTRACTION_SPEC.name):
+            page.evaluate(self.EXTRACTION_SPEC.compile())
+
     def _extract_invitations_from_page(
         self,
         page: Page,
         start_index: int,
         end_index: Optional[int] = None,
     ) -> int:
-        invitation_cards = page.query_selector_all(self.CARD_SELECTOR)
-        total_cards = len(invitation_cards)
-        if not total_cards:
-            return 0
-
-        safe_start = min(start_index, total_cards)
-        safe_end = min(end_index or total_cards, total_cards)
-        if safe_start >= safe_end:
+        try:
+            self._ensure_extractor(page)
+            batch = page.evaluate(
+                EXTRACT_BATCH_SCRIPT,
+                {"name": self.EXTRACTION_SPEC.name, "start": start_index, "end": end_index},
+            )
+        except Exception as exc:
+            self.logger.log_error(f"In-page extraction failed: {exc}")
             return 0
 
-        cards_slice = invitation_cards[safe_start:safe_end]
         new_entries = 0
+        for item in batch.get('items', []):
+            if item.get('error'):
+                self._log_unparsed_html(item.get('html') or "", item['error'])
+                continue
 
-        for card in cards_slice:
             try:
-                entry = self._parse_invitation_card(card)
-                self.total_cards_seen += 1
-
-                if self.deduplicator.is_duplicate(entry.profile_url):
-                    self.duplicates_found += 1
-                    continue
-
-                self.entries.append(entry)
-                self.deduplicator.add_url(entry.profile_url)
-                self._persist_resume_state()
-                new_entries += 1
-
-            except ValueError as exc:
-                self._log_unparsed_card(card, str(exc))
+                entry = self.EXTRACTION_SPEC.build_entry(item['values'])
             except Exception as exc:
-                self._log_unparsed_card(card, "Unhandled parsing error", exc)
-
-        return new_entries
+                self._log_unparsed_html("", f"Unhandled parsing error: {exc}")
+                continue
 
-    def _parse_invitation_card(self, card) -> InvitationEntry:
-        profile_link = card.query_selector('a[href*="/in/"]')
-        if not profile_link:
-            profile_link = card.query_selector('a.invitation-card__link')
-        if not profile_link:
-            profile_link = card.query_selector('a[data-control-name*="profile"]')
-        if not profile_link:
-            raise ValueError("Profile link not found")
-
-        profile_url = profile_link.get_attribute('href')
-        if not profile_url:
-            raise ValueError("Profile URL attribute missing")
-        profile_url = profile_url.strip()
-        if profile_url.startswith('/'):
-            profile_url = f"https://www.linkedin.com{profile_url}"
-        profile_url = profile_url.split('?')[0]
-
-        profile_name = self._extract_text(card, self.NAME_SELECTORS)
-        if not profile_name:
-            profile_name = profile_link.inner_text().strip() if profile_link else None
-        if not profile_name:
-            raise ValueError("Profile name not found")
-
-        invitation_date = self._extract_text(card, self.DATE_SELECTORS)
-        if not invitation_date:
-            invitation_date = self._extract_line_with_keyword(card, 'Sent') or ""
-
-        invited_to = self._extract_text(card, self.INVITED_TO_SELECTORS)
-        if not invited_to:
-            invited_to = self._extract_line_with_keyword(card, 'Invited to follow') or ""
-
-        return InvitationEntry(
-            profile_name=profile_name,
-            profile_url=profile_url,
-            invitation_date=invitation_date,
-            invited_to=invited_to,
-        )
+            self.total_cards_seen += 1
+            self.last_card_at = time.monotonic()
+            self.run_entries.append(entry)
 
-    @staticmethod
-    def _extract_text(card, selectors: List[str]) -> Optional[str]:
-        for selector in selectors:
-            element = card.query_selector(selector)
-            if not element:
+            key = self.EXTRACTION_SPEC.entry_key(entry)
+            if self.deduplicator.is_duplicate(key):
+                self.duplicates_found += 1
                 continue
-            try:
-                text = element.inner_text().strip()
-            except Exception:
-                text = None
-            if text:
-                return text
-        return None
 
-    @staticmethod
-    def _extract_line_with_keyword(card, keyword: str) -> Optional[str]:
-        try:
-            content = card.inner_text()
-        except Exception:
-            return None
-        if not content:
-            return None
-        keyword_lower = keyword.lower()
-        for line in content.splitlines():
-            cleaned = line.strip()
-            if keyword_lower in cleaned.lower():
-                return cleaned
-        return None
+            self.entries.append(entry)
+            self.last_new_card_at = time.monotonic()
+            self.deduplicator.add_url(key)
+            self._persist_resume_state()
+            new_entries += 1
+
+        return new_entries
 
     def _persist_resume_state(self):
         try:
@@ -306,35 +564,89 @@ class LinkedInInvitationsScraper:
         except Exception as exc:
             self.logger.log_warning(f"Failed to persist resume state: {exc}")
 
-    def _log_unparsed_card(self, card, reason: str, exception: Optional[Exception] = None):
-        try:
-            html = card.inner_html()
-        except Exception:
-            html = ""
+    def _log_unparsed_html(self, html: str, reason: str):
         snippet = html[: self.config.max_html_snippet_length] if html else "N/A"
-        details = reason if not exception else f"{reason}: {exception}"
-        self.logger.log_unparsed_item(snippet, details, full_html=html)
+        self.logger.log_unparsed_item(snippet, reason, full_html=html)
+
+    def _write_run_diff(self):
+        if not self.run_entries and self.logger.parsing_errors:
+            self.logger.log_warning(
+                "No invitations parsed and parsing errors occurred. Snapshot diff was skipped."
+            )
+            return
+        if not self.run_entries:
+            self.logger.log_warning(
+                "No invitations seen in this run. All previously seen invitations are reported as vanished."
+            )
+
+        snapshot_path = self.config.snapshot_file
+        pending_path = snapshot_path.with_name(f"{snapshot_path.name}.tmp")
+        encoding = self.config.output_encoding
+
+        try:
+            if self.run_entries:
+                current_df = postprocess_frame(
+                    pd.DataFrame([asdict(entry) for entry in self.run_entries]),
+                    self.logger.start_time,
+                )
+            else:
+                current_df = pd.DataFrame(columns=self.output_columns)
+            write_snapshot(
+                current_df,
+                pending_path,
+                encoding=encoding,
+                columns=self.output_columns,
+                key=self.EXTRACTION_SPEC.key_field,
+            )
+            stats = diff_snapshots(
+                snapshot_path if snapshot_path.exists() else None,
+                pending_path,
+                self.config.diff_csv,
+                encoding=encoding,
+                columns=self.output_columns,
+                key=self.EXTRACTION_SPEC.key_field,
+            )
+            pending_path.replace(snapshot_path)
+        except Exception as exc:
+            self.logger.log_warning(f"Failed to write run diff: {exc}")
+            return
+
+        self.logger.set_diff_counts(stats.new, stats.vanished, stats.unchanged)
+        self.logger.log_progress(
+            f"Diff file saved: {self.config.diff_csv} "
+            f"({stats.new} new, {stats.vanished} vanished, {stats.unchanged} unchanged)"
+        )
 
     def _save_results(self) -> Optional[str]:
-        records = [asdict(entry) for entry in self.entries]
         csv_path = self.config.output_csv
         xlsx_path = self.config.output_xlsx
 
+        frames = []
         if csv_path.exists():
             try:
                 existing_df = pd.read_csv(csv_path, encoding=self.config.output_encoding)
                 if not existing_df.empty:
-                    records = existing_df.to_dict('records') + records
+                    if 'profile_url' in existing_df.columns:
+                        existing_df['profile_url'] = canonicalize_profile_urls(existing_df['profile_url'])
+                    if RESOLVED_DATE_COLUMN in existing_df.columns:
+                        existing_df[RESOLVED_DATE_COLUMN] = normalize_resolved_dates(
+                            existing_df[RESOLVED_DATE_COLUMN]
+                        )
+                    frames.append(existing_df)
             except Exception as exc:
                 self.logger.log_warning(f"Failed to read existing CSV: {exc}")
 
-        if not records:
+        if self.entries:
+            new_df = pd.DataFrame([asdict(entry) for entry in self.entries])
+            frames.append(postprocess_frame(new_df, self.logger.start_time))
+
+        if not frames:
             self.logger.log_warning("No invitations collected. Output files were not updated.")
             return None
 
-        df = pd.DataFrame(records)
-        df = df[['profile_name', 'profile_url', 'invitation_date', 'invited_to']]
-        df = df.drop_duplicates(subset=['profile_url']).reset_index(drop=True)
+        df = pd.concat(frames, ignore_index=True)
+        df = df.reindex(columns=self.output_columns)
+        df = df.drop_duplicates(subset=[self.EXTRACTION_SPEC.key_field]).reset_index(drop=True)
 
         csv_path.parent.mkdir(parents=True, exist_ok=True)
         xlsx_path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,43 @@
+import math
+from collections import deque
+from typing import Deque, Optional
+
+
+class AdaptiveTimeout:
+    def __init__(
+        self,
+        initial_ms: int = 8000,
+        min_ms: int = 1500,
+        max_ms: int = 15000,
+        percentile: float = 0.95,
+        multiplier: float = 2.0,
+        min_samples: int = 5,
+        window: int = 50,
+    ):
+        self.initial_ms = initial_ms
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency_ms: float) -> None:
+        self.samples.append(max(0.0, latency_ms))
+
+    def record_timeout(self, waited_ms: float) -> None:
+        self.samples.append(max(0.0, waited_ms))
+
+    def latency_percentile(self) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(0, math.ceil(self.percentile * len(ordered)) - 1)
+        return ordered[rank]
+
+    @property
+    def timeout_ms(self) -> int:
+        if len(self.samples) < self.min_samples:
+            return self.initial_ms
+        adaptive = self.latency_percentile() * self.multiplier
+        return int(min(self.max_ms, max(self.min_ms, adaptive)))
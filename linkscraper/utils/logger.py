@@ -2,7 +2,7 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class ScraperLogger:
@@ -27,6 +27,7 @@ class ScraperLogger:
         self.scroll_count = 0
         self.parsing_errors = 0
         self.scroll_time: Optional[float] = None
+        self.diff_counts: Optional[Tuple[int, int, int]] = None
     
     def _setup_logger(self, name: str, log_file: Path, console_output: bool = True) -> logging.Logger:
         logger = logging.getLogger(name)
@@ -84,6 +85,11 @@ class ScraperLogger:
         if self.scroll_time is not None:
             self.main_logger.info(f"  Scroll duration: {self.scroll_time:.2f}s")
         self.main_logger.info(f"  Parsing errors: {self.parsing_errors}")
+        if self.diff_counts is not None:
+            new, vanished, unchanged = self.diff_counts
+            self.main_logger.info(
+                f"  Since previous run: {new} new, {vanished} vanished, {unchanged} unchanged"
+            )
         self.main_logger.info(f"  Output file: {output_file}")
         self.main_logger.info("=" * 80)
     
@@ -121,3 +127,6 @@ class ScraperLogger:
     
     def set_scroll_time(self, time_seconds: float):
         self.scroll_time = time_seconds
+    
+    def set_diff_counts(self, new: int, vanished: int, unchanged: int):
+        self.diff_counts = (new, vanished, unchanged)
@@ -0,0 +1,269 @@
+import sqlite3
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+from linkscraper.utils.logger import ScraperLogger
+from linkscraper.utils.postprocess import (
+    RESOLVED_DATE_COLUMN,
+    canonicalize_profile_urls,
+    normalize_resolved_dates,
+    output_columns,
+)
+
+SUPPORTED_SUFFIXES = ('.csv', '.parquet')
+DEFAULT_KEY = 'profile_url'
+
+
+@dataclass
+class MergeStats:
+    files: int = 0
+    rows_read: int = 0
+    rows_written: int = 0
+    duplicates: int = 0
+    missing_urls: int = 0
+    duration: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.duration <= 0:
+            return 0.0
+        return self.rows_read / self.duration
+
+
+class KeyIndex:
+    def __init__(self, path: Path):
+        self.path = path
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute("PRAGMA journal_mode=OFF")
+        self.connection.execute("PRAGMA synchronous=OFF")
+        self.connection.execute("PRAGMA temp_store=FILE")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        self.connection.execute(
+            "CREATE TEMP TABLE chunk_keys (pos INTEGER PRIMARY KEY, key TEXT NOT NULL)"
+        )
+
+    def filter_new(self, keys: Sequence[str]) -> List[int]:
+        cursor = self.connection.cursor()
+        cursor.execute("DELETE FROM chunk_keys")
+        cursor.executemany(
+            "INSERT INTO chunk_keys (pos, key) VALUES (?, ?)",
+            enumerate(keys),
+        )
+        new_positions = [
+            row[0]
+            for row in cursor.execute(
+                "SELECT pos FROM chunk_keys WHERE key NOT IN (SELECT key FROM seen) ORDER BY pos"
+            )
+        ]
+        cursor.execute("INSERT OR IGNORE INTO seen (key) SELECT key FROM chunk_keys")
+        self.connection.commit()
+        return new_positions
+
+    def close(self):
+        self.connection.close()
+
+
+def iter_output_chunks(path: Path, chunk_size: int, encoding: str = "utf-8") -> Iterator[pd.DataFrame]:
+    suffix = path.suffix.lower()
+    if suffix == '.csv':
+        yield from pd.read_csv(
+            path,
+            encoding=encoding,
+            dtype=str,
+            keep_default_na=False,
+            na_values=[""],
+            chunksize=chunk_size,
+        )
+    elif suffix == '.parquet':
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported file type: {path} (expected one of {', '.join(SUPPORTED_SUFFIXES)})")
+
+
+def read_columns(path: Path, encoding: str = "utf-8") -> List[str]:
+    if path.suffix.lower() == '.parquet':
+        import pyarrow.parquet as pq
+
+        return list(pq.read_schema(path).names)
+    return list(pd.read_csv(path, encoding=encoding, nrows=0).columns)
+
+
+def resolve_merge_columns(inputs: Sequence[Path], key: str = DEFAULT_KEY, encoding: str = "utf-8") -> List[str]:
+    columns = output_columns(read_columns(inputs[0], encoding))
+    if key not in columns:
+        raise ValueError(f"Key column '{key}' not found in {inputs[0]}")
+    for path in inputs[1:]:
+        path_columns = output_columns(read_columns(path, encoding))
+        if set(path_columns) != set(columns):
+            raise ValueError(
+                f"Columns of {path} ({', '.join(path_columns)}) do not match "
+                f"{inputs[0]} ({', '.join(columns)})"
+            )
+    return columns
+
+
+def _normalize_chunk(chunk: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    chunk = chunk.reindex(columns=list(columns))
+    if RESOLVED_DATE_COLUMN in chunk.columns:
+        dates = chunk[RESOLVED_DATE_COLUMN]
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            chunk[RESOLVED_DATE_COLUMN] = dates.dt.strftime('%Y-%m-%d')
+    chunk = chunk.astype("string")
+    if RESOLVED_DATE_COLUMN in chunk.columns:
+        chunk[RESOLVED_DATE_COLUMN] = normalize_resolved_dates(chunk[RESOLVED_DATE_COLUMN])
+    if 'profile_url' in chunk.columns:
+        chunk['profile_url'] = canonicalize_profile_urls(chunk['profile_url'])
+    return chunk
+
+
+def _string_schema(columns: Sequence[str]):
+    import pyarrow as pa
+
+    return pa.schema([(column, pa.string()) for column in columns])
+
+
+class _OutputWriter:
+    def __init__(self, path: Path, encoding: str, columns: Sequence[str]):
+        self.path = path
+        self.encoding = encoding
+        self.columns = list(columns)
+        self.suffix = path.suffix.lower()
+        self.rows = 0
+        self._parquet_writer = None
+
+        if self.suffix not in SUPPORTED_SUFFIXES:
+            raise ValueError(f"Unsupported output type: {path} (expected one of {', '.join(SUPPORTED_SUFFIXES)})")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.suffix == '.csv':
+            pd.DataFrame(columns=self.columns).to_csv(path, index=False, encoding=encoding)
+
+    def write(self, chunk: pd.DataFrame):
+        if chunk.empty:
+            return
+        if self.suffix == '.csv':
+            chunk.to_csv(self.path, mode='a', header=False, index=False, encoding=self.encoding)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            schema = _string_schema(self.columns)
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(str(self.path), schema)
+            self._parquet_writer.write_table(table)
+        self.rows += len(chunk)
+
+    def close(self):
+        if self.suffix == '.parquet':
+            import pyarrow.parquet as pq
+
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(str(self.path), _string_schema(self.columns))
+            self._parquet_writer.close()
+
+
+def validate_merge_paths(inputs: Sequence[Path], output: Path, index_path: Optional[Path] = None) -> None:
+    if not inputs:
+        raise ValueError("No input files given")
+
+    for path in list(inputs) + [output]:
+        if path.suffix.lower() not in SUPPORTED_SUFFIXES:
+            raise ValueError(f"Unsupported file type: {path} (expected one of {', '.join(SUPPORTED_SUFFIXES)})")
+
+    missing = [str(path) for path in inputs if not path.is_file()]
+    if missing:
+        raise FileNotFoundError(f"Input files not found: {', '.join(missing)}")
+
+    if output.resolve() in {path.resolve() for path in inputs}:
+        raise ValueError(f"Output file must not be one of the inputs: {output}")
+
+    if index_path is not None:
+        if index_path.exists():
+            raise FileExistsError(f"Index file already exists: {index_path}")
+        if not index_path.parent.is_dir():
+            raise FileNotFoundError(f"Index directory not found: {index_path.parent}")
+
+    if any(path.suffix.lower() == '.parquet' for path in list(inputs) + [output]):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ValueError("Parquet files require pyarrow (pip install pyarrow)") from None
+
+
+def merge_outputs(
+    inputs: Sequence[Path],
+    output: Path,
+    chunk_size: int = 100_000,
+    encoding: str = "utf-8",
+    index_path: Optional[Path] = None,
+    logger: Optional[ScraperLogger] = None,
+    key: str = DEFAULT_KEY,
+) -> MergeStats:
+    output = Path(output)
+    resolved_inputs = [Path(path) for path in inputs]
+    index_path = Path(index_path) if index_path is not None else None
+    validate_merge_paths(resolved_inputs, output, index_path)
+    columns = resolve_merge_columns(resolved_inputs, key, encoding)
+
+    stats = MergeStats()
+    start = time.perf_counter()
+
+    temp_dir = None
+    if index_path is None:
+        temp_dir = tempfile.TemporaryDirectory(prefix="linkscraper-merge-")
+        index_path = Path(temp_dir.name) / "keys.sqlite"
+
+    partial_output = output.with_name(f"{output.stem}.partial{output.suffix}")
+    index = KeyIndex(index_path)
+    writer = _OutputWriter(partial_output, encoding, columns)
+    completed = False
+    try:
+        for path in resolved_inputs:
+            stats.files += 1
+            for raw_chunk in iter_output_chunks(path, chunk_size, encoding):
+                stats.rows_read += len(raw_chunk)
+                chunk = _normalize_chunk(raw_chunk, columns)
+
+                has_key = chunk[key].notna().to_numpy(dtype=bool)
+                stats.missing_urls += int((~has_key).sum())
+                chunk = chunk[has_key]
+
+                unique_chunk = chunk.drop_duplicates(subset=[key])
+                new_positions = index.filter_new(unique_chunk[key].tolist())
+                new_rows = unique_chunk.iloc[new_positions]
+
+                stats.duplicates += len(chunk) - len(new_rows)
+                writer.write(new_rows)
+
+            if logger:
+                elapsed = time.perf_counter() - start
+                logger.log_progress(
+                    f"Merged {path}: {stats.rows_read} rows read, {writer.rows} unique "
+                    f"({stats.rows_read / elapsed if elapsed else 0:.0f} rows/s)"
+                )
+        completed = True
+    finally:
+        writer.close()
+        index.close()
+        if temp_dir is not None:
+            temp_dir.cleanup()
+        if completed:
+            partial_output.replace(output)
+        elif partial_output.exists():
+            partial_output.unlink()
+
+    stats.rows_written = writer.rows
+    stats.duration = time.perf_counter() - start
+    return stats
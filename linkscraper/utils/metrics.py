@@ -0,0 +1,81 @@
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass
+class Metric:
+    name: str
+    kind: str
+    help: str
+    value: Optional[float]
+
+
+def render_metrics(metrics: List[Metric], prefix: str = "linkscraper") -> str:
+    lines = []
+    for metric in metrics:
+        name = f"{prefix}_{metric.name}"
+        lines.append(f"# HELP {name} {metric.help}")
+        lines.append(f"# TYPE {name} {metric.kind}")
+        value = "NaN" if metric.value is None else repr(float(metric.value))
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    def __init__(
+        self,
+        collect: Callable[[], List[Metric]],
+        port: int,
+        host: str = "127.0.0.1",
+    ):
+        self.collect = collect
+        self.port = port
+        self.host = host
+        self.server: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> int:
+        collect = self.collect
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                try:
+                    body = render_metrics(collect()).encode('utf-8')
+                except Exception as exc:
+                    self.send_error(500, str(exc))
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            name="linkscraper-metrics",
+            daemon=True,
+        )
+        self.thread.start()
+        return self.port
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if self.thread:
+            self.thread.join(timeout=5)
+            self.thread = None
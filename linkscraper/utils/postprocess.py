@@ -0,0 +1,131 @@
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+RESOLVED_DATE_COLUMN = "invitation_sent_on"
+
+
+def output_columns(fields: Sequence[str]) -> List[str]:
+    columns = list(fields)
+    if 'invitation_date' in columns and RESOLVED_DATE_COLUMN not in columns:
+        columns.append(RESOLVED_DATE_COLUMN)
+    return columns
+
+
+OUTPUT_COLUMNS = output_columns(['profile_name', 'profile_url', 'invitation_date', 'invited_to'])
+
+_RELATIVE_DATE_PATTERN = (
+    r"(?P<amount>\d+)\s*"
+    r"(?P<unit>minutes?|mins?|hours?|hrs?|h|days?|d|weeks?|wks?|w|months?|mos?|years?|yrs?|y)\b"
+)
+
+_UNIT_SECONDS = {
+    'minute': 60,
+    'minutes': 60,
+    'min': 60,
+    'mins': 60,
+    'hour': 3600,
+    'hours': 3600,
+    'hr': 3600,
+    'hrs': 3600,
+    'h': 3600,
+    'day': 86400,
+    'days': 86400,
+    'd': 86400,
+    'week': 7 * 86400,
+    'weeks': 7 * 86400,
+    'wk': 7 * 86400,
+    'wks': 7 * 86400,
+    'w': 7 * 86400,
+    'month': 30 * 86400,
+    'months': 30 * 86400,
+    'mo': 30 * 86400,
+    'mos': 30 * 86400,
+    'year': 365 * 86400,
+    'years': 365 * 86400,
+    'yr': 365 * 86400,
+    'yrs': 365 * 86400,
+    'y': 365 * 86400,
+}
+
+
+def canonicalize_profile_urls(urls: pd.Series) -> pd.Series:
+    cleaned = urls.astype("string").str.strip()
+    cleaned = cleaned.str.replace(r"[?#].*$", "", regex=True)
+    cleaned = cleaned.str.replace(
+        r"^(?:https?://)?(?:[a-z]{2,3}\.|www\.)?linkedin\.com",
+        LINKEDIN_BASE_URL,
+        regex=True,
+        case=False,
+    )
+    cleaned = cleaned.str.replace(r"^/", f"{LINKEDIN_BASE_URL}/", regex=True)
+
+    slug = cleaned.str.extract(r"/in/([^/]+)", expand=False).str.lower()
+    profile_urls = f"{LINKEDIN_BASE_URL}/in/" + slug + "/"
+    other_urls = cleaned.str.rstrip("/") + "/"
+
+    return profile_urls.fillna(other_urls).where(cleaned.fillna("").str.len() > 0, pd.NA)
+
+
+def resolve_relative_dates(dates: pd.Series, run_timestamp: datetime) -> pd.Series:
+    text = dates.astype("string").str.lower().str.strip()
+    parts = text.str.extract(_RELATIVE_DATE_PATTERN)
+
+    amounts = pd.to_numeric(parts['amount'], errors='coerce')
+    unit_seconds = parts['unit'].map(_UNIT_SECONDS).astype("float64")
+    offset_seconds = amounts * unit_seconds
+
+    offset_seconds = offset_seconds.mask(text.str.contains(r"\b(?:today|just now)\b", na=False), 0)
+    offset_seconds = offset_seconds.mask(text.str.contains(r"\byesterday\b", na=False), 86400)
+
+    reference = pd.Timestamp(run_timestamp)
+    resolved = reference - pd.to_timedelta(offset_seconds, unit='s')
+    return resolved.dt.normalize()
+
+
+def normalize_invited_to(values: pd.Series) -> pd.Series:
+    normalized = values.astype("string").str.replace(r"\s+", " ", regex=True).str.strip()
+    normalized = normalized.str.replace(
+        r"^invited\s+to\s+follow\s*:?\s*",
+        "Invited to follow ",
+        regex=True,
+        case=False,
+    ).str.strip()
+    return normalized.fillna("")
+
+
+def normalize_resolved_dates(dates: pd.Series) -> pd.Series:
+    return dates.astype("string").str.strip().str.slice(0, 10)
+
+
+def postprocess_frame(df: pd.DataFrame, run_timestamp: Optional[datetime] = None) -> pd.DataFrame:
+    run_timestamp = run_timestamp or datetime.now()
+    result = df.copy()
+
+    if 'profile_url' in result.columns:
+        result['profile_url'] = canonicalize_profile_urls(result['profile_url'])
+    if 'invited_to' in result.columns:
+        result['invited_to'] = normalize_invited_to(result['invited_to'])
+    if 'invitation_date' in result.columns:
+        resolved = resolve_relative_dates(result['invitation_date'], run_timestamp)
+        result[RESOLVED_DATE_COLUMN] = resolved.dt.strftime('%Y-%m-%d').astype("string")
+
+    return result
+
+
+def postprocess_invitations(data, run_timestamp: Optional[datetime] = None):
+    if isinstance(data, pd.DataFrame):
+        return postprocess_frame(data, run_timestamp)
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+
+    if pa is not None and isinstance(data, pa.Table):
+        processed = postprocess_frame(data.to_pandas(), run_timestamp)
+        return pa.Table.from_pandas(processed, preserve_index=False)
+
+    raise TypeError(f"Unsupported input type for post-processing: {type(data).__name__}")
@@ -0,0 +1,86 @@
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+from linkscraper.utils.postprocess import OUTPUT_COLUMNS
+
+DEFAULT_KEY = 'profile_url'
+
+
+@dataclass
+class DiffStats:
+    new: int = 0
+    vanished: int = 0
+    unchanged: int = 0
+
+
+def write_snapshot(
+    df: pd.DataFrame,
+    path: Path,
+    encoding: str = "utf-8",
+    columns: Sequence[str] = OUTPUT_COLUMNS,
+    key: str = DEFAULT_KEY,
+) -> int:
+    snapshot = df.reindex(columns=list(columns))
+    snapshot = snapshot[snapshot[key].notna()]
+    snapshot = snapshot.drop_duplicates(subset=[key])
+    snapshot = snapshot.sort_values(key, kind='stable')
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    snapshot.to_csv(path, index=False, encoding=encoding)
+    return len(snapshot)
+
+
+def _iter_sorted_rows(path: Optional[Path], key: str, encoding: str) -> Iterator[Dict[str, str]]:
+    if path is None or not path.exists():
+        return
+    with open(path, 'r', encoding=encoding, newline='') as file:
+        previous_key = None
+        for row in csv.DictReader(file):
+            value = row.get(key)
+            if not value:
+                continue
+            if previous_key is not None and value <= previous_key:
+                raise ValueError(f"Snapshot is not sorted by {key}: {path}")
+            previous_key = value
+            yield row
+
+
+def diff_snapshots(
+    previous_path: Optional[Path],
+    current_path: Path,
+    diff_path: Path,
+    encoding: str = "utf-8",
+    columns: Sequence[str] = OUTPUT_COLUMNS,
+    key: str = DEFAULT_KEY,
+) -> DiffStats:
+    stats = DiffStats()
+    previous_rows = _iter_sorted_rows(previous_path, key, encoding)
+    current_rows = _iter_sorted_rows(current_path, key, encoding)
+    fieldnames: List[str] = ['status'] + list(columns)
+
+    diff_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(diff_path, 'w', encoding=encoding, newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+
+        previous = next(previous_rows, None)
+        current = next(current_rows, None)
+        while previous is not None or current is not None:
+            if current is None or (previous is not None and previous[key] < current[key]):
+                writer.writerow({**previous, 'status': 'vanished'})
+                stats.vanished += 1
+                previous = next(previous_rows, None)
+            elif previous is None or current[key] < previous[key]:
+                writer.writerow({**current, 'status': 'new'})
+                stats.new += 1
+                current = next(current_rows, None)
+            else:
+                stats.unchanged += 1
+                previous = next(previous_rows, None)
+                current = next(current_rows, None)
+
+    return stats
@@ -0,0 +1,108 @@
+import time
+
+import pytest
+
+from linkscraper.utils.adaptive_wait import AdaptiveTimeout
+
+
+def test_initial_timeout_until_enough_samples():
+    timeout = AdaptiveTimeout(initial_ms=8000, min_samples=3)
+
+    timeout.record(100)
+    timeout.record(100)
+
+    assert timeout.timeout_ms == 8000
+
+
+def test_timeout_follows_percentile_within_bounds():
+    timeout = AdaptiveTimeout(min_ms=1500, max_ms=15000, min_samples=3)
+    for latency in [1000, 1200, 2000, 3000]:
+        timeout.record(latency)
+
+    assert timeout.latency_percentile() == 3000
+    assert timeout.timeout_ms == 6000
+
+    fast = AdaptiveTimeout(min_ms=1500, min_samples=1)
+    fast.record(100)
+    assert fast.timeout_ms == 1500
+
+    slow = AdaptiveTimeout(max_ms=15000, min_samples=1)
+    slow.record(60000)
+    assert slow.timeout_ms == 15000
+
+
+def test_censored_timeouts_push_estimate_up():
+    timeout = AdaptiveTimeout(min_ms=500, min_samples=3)
+    for _ in range(3):
+        timeout.record(400)
+    before = timeout.timeout_ms
+
+    timeout.record_timeout(before)
+
+    assert timeout.latency_percentile() == before
+    assert timeout.timeout_ms > before
+
+
+class FakeListPage:
+    def __init__(self, latency_ms):
+        self.latency_ms = latency_ms
+        self.cards = 0
+        self.grew_at_ms = None
+        self.idle = False
+
+    def wait_for_function(self, expression, arg=None, timeout=None):
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        if self.idle:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded.")
+        self.cards += 10
+        self.grew_at_ms = time.time() * 1000 + self.latency_ms
+
+    def evaluate(self, expression, arg=None):
+        if "__linkscraperCardGrowthAt = null" in expression:
+            self.grew_at_ms = None
+            return None
+        if "__linkscraperCardGrowthAt" in expression:
+            return self.grew_at_ms
+        return self.cards
+
+
+def make_scraper(tmp_path):
+    pytest.importorskip("playwright")
+    from linkscraper.config import ScraperConfig
+    from linkscraper.scrapers.linkedin_invitations import LinkedInInvitationsScraper
+
+    return LinkedInInvitationsScraper(ScraperConfig(logs_dir=tmp_path / "logs"))
+
+
+def run_rounds(scraper, page, rounds):
+    for _ in range(rounds):
+        scraper._start_batch(page)
+        scraper._wait_for_new_content(page, page.cards)
+
+
+def test_idle_round_does_not_inflate_timeout_for_fast_server(tmp_path):
+    scraper = make_scraper(tmp_path)
+    page = FakeListPage(latency_ms=800)
+    run_rounds(scraper, page, 10)
+    fast_timeout = scraper.wait_timeout.timeout_ms
+
+    page.idle = True
+    run_rounds(scraper, page, 1)
+
+    assert fast_timeout == pytest.approx(1600, abs=100)
+    assert scraper.wait_timeouts == 1
+    assert scraper.wait_timeout.timeout_ms == fast_timeout
+
+
+def test_timeout_with_pending_list_request_raises_estimate(tmp_path):
+    scraper = make_scraper(tmp_path)
+    page = FakeListPage(latency_ms=800)
+    run_rounds(scraper, page, 10)
+    fast_timeout = scraper.wait_timeout.timeout_ms
+
+    page.idle = True
+    scraper.pending_list_requests[object()] = time.monotonic()
+    run_rounds(scraper, page, 1)
+
+    assert scraper.wait_timeout.timeout_ms > fast_timeout
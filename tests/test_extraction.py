@@ -0,0 +1,82 @@
+from dataclasses import asdict, is_dataclass
+
+import pandas as pd
+import pytest
+
+from linkscraper.scrapers.extraction import ExtractionSpec, FieldSpec
+
+
+def make_connections_spec():
+    return ExtractionSpec(
+        name="connections",
+        card_selectors=["li.mn-connection-card"],
+        fields=[
+            FieldSpec('profile_url', selectors=['a[href*="/in/"]'], attribute='href',
+                      transforms=['trim', 'absolute_url', 'strip_query'], required=True),
+            FieldSpec('profile_name', selectors=['.mn-connection-card__name'], required=True),
+            FieldSpec('occupation', selectors=['.mn-connection-card__occupation']),
+            FieldSpec('connected_on', selectors=['time'], keyword='Connected'),
+        ],
+        base_url="https://www.linkedin.com",
+    )
+
+
+def test_spec_generates_entry_dataclass_with_defaults():
+    spec = make_connections_spec()
+
+    entry = spec.build_entry({'profile_url': "https://www.linkedin.com/in/a/", 'profile_name': "A"})
+
+    assert is_dataclass(entry)
+    assert asdict(entry) == {
+        'profile_url': "https://www.linkedin.com/in/a/",
+        'profile_name': "A",
+        'occupation': "",
+        'connected_on': "",
+    }
+    assert spec.entry_key(entry) == "https://www.linkedin.com/in/a/"
+
+
+def test_spec_compiles_once_and_embeds_fields():
+    spec = make_connections_spec()
+
+    script = spec.compile()
+
+    assert spec.compile() is script
+    assert "li.mn-connection-card" in script
+    assert "connected_on" in script
+
+
+def test_spec_rejects_unknown_key_field_and_transforms():
+    with pytest.raises(ValueError):
+        ExtractionSpec(name="bad", card_selectors=["li"], fields=[FieldSpec('name')])
+    with pytest.raises(ValueError):
+        FieldSpec('profile_url', transforms=['lowercase'])
+
+
+def test_subclass_spec_fields_reach_output_files(tmp_path):
+    pytest.importorskip("playwright")
+    pytest.importorskip("openpyxl")
+    from linkscraper.config import ScraperConfig
+    from linkscraper.scrapers.linkedin_invitations import LinkedInInvitationsScraper
+
+    class ConnectionsScraper(LinkedInInvitationsScraper):
+        EXTRACTION_SPEC = make_connections_spec()
+
+    config = ScraperConfig(
+        output_csv=tmp_path / "output.csv",
+        output_xlsx=tmp_path / "output.xlsx",
+        resume_state_file=tmp_path / "state.json",
+        logs_dir=tmp_path / "logs",
+    )
+    scraper = ConnectionsScraper(config)
+    spec = scraper.EXTRACTION_SPEC
+    scraper.entries = [
+        spec.build_entry({'profile_url': "/in/a", 'profile_name': "A", 'occupation': "Engineer"}),
+        spec.build_entry({'profile_url': "/in/a/", 'profile_name': "A again", 'occupation': "Manager"}),
+    ]
+
+    scraper._save_results()
+
+    saved = pd.read_csv(config.output_csv, dtype=str, keep_default_na=False)
+    assert list(saved.columns) == ['profile_url', 'profile_name', 'occupation', 'connected_on']
+    assert saved['occupation'].tolist() == ["Engineer"]
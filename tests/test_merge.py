@@ -0,0 +1,125 @@
+import pandas as pd
+import pytest
+
+from linkscraper.utils.merge import merge_outputs
+
+
+def write_csv(path, rows):
+    pd.DataFrame(rows, columns=['profile_name', 'profile_url', 'invitation_date', 'invited_to']).to_csv(
+        path, index=False
+    )
+    return path
+
+
+def test_merge_keeps_first_seen_row_across_files_and_chunks(tmp_path):
+    first = write_csv(tmp_path / "first.csv", [
+        ("A", "https://www.linkedin.com/in/a/", "Sent today", "Acme"),
+        ("B", "https://www.linkedin.com/in/b/?mini=1", "Sent today", "Acme"),
+        ("A again", "/in/A", "Sent today", "Acme"),
+        ("C", "https://www.linkedin.com/in/c/", "Sent today", "Acme"),
+        ("No URL", None, "Sent today", "Acme"),
+    ])
+    second = write_csv(tmp_path / "second.csv", [
+        ("B later", "https://uk.linkedin.com/in/b", "Sent 1 week ago", "Globex"),
+        ("D", "https://www.linkedin.com/in/d/", "Sent 1 week ago", "Globex"),
+    ])
+    output = tmp_path / "merged.csv"
+
+    stats = merge_outputs([first, second], output, chunk_size=2)
+
+    merged = pd.read_csv(output, dtype=str)
+    assert merged['profile_name'].tolist() == ["A", "B", "C", "D"]
+    assert merged['profile_url'].tolist() == [
+        "https://www.linkedin.com/in/a/",
+        "https://www.linkedin.com/in/b/",
+        "https://www.linkedin.com/in/c/",
+        "https://www.linkedin.com/in/d/",
+    ]
+    assert stats.rows_read == 7
+    assert stats.rows_written == 4
+    assert stats.duplicates == 2
+    assert stats.missing_urls == 1
+
+
+def test_merge_parquet_output_matches_csv_order(tmp_path):
+    pytest.importorskip("pyarrow")
+    first = write_csv(tmp_path / "first.csv", [
+        ("A", "/in/a", "Sent today", "Acme"),
+        ("B", "/in/b", "Sent today", "Acme"),
+    ])
+    parquet_input = tmp_path / "second.parquet"
+    pd.DataFrame({
+        'profile_name': ["B later", "C"],
+        'profile_url': ["/in/b", "/in/c"],
+        'invitation_date': ["Sent today", "Sent today"],
+        'invited_to': ["Acme", "Acme"],
+    }).to_parquet(parquet_input)
+    output = tmp_path / "merged.parquet"
+
+    merge_outputs([first, parquet_input], output)
+
+    assert pd.read_parquet(output)['profile_name'].tolist() == ["A", "B", "C"]
+
+
+def test_merge_validates_inputs_before_writing(tmp_path):
+    first = write_csv(tmp_path / "first.csv", [("A", "/in/a", "Sent today", "Acme")])
+    output = tmp_path / "merged.csv"
+
+    with pytest.raises(FileNotFoundError):
+        merge_outputs([first, tmp_path / "missing.csv"], output)
+    with pytest.raises(ValueError):
+        merge_outputs([first, tmp_path / "notes.txt"], output)
+
+    assert not output.exists()
+    assert list(tmp_path.iterdir()) == [first]
+
+
+def test_merge_refuses_to_overwrite_existing_index(tmp_path):
+    first = write_csv(tmp_path / "first.csv", [("A", "/in/a", "Sent today", "Acme")])
+    index_path = tmp_path / "keys.sqlite"
+    index_path.write_text("keep me")
+
+    with pytest.raises(FileExistsError):
+        merge_outputs([first], tmp_path / "merged.csv", index_path=index_path)
+
+    assert index_path.read_text() == "keep me"
+
+
+def test_merge_rejects_missing_index_directory(tmp_path):
+    first = write_csv(tmp_path / "first.csv", [("A", "/in/a", "Sent today", "Acme")])
+    output = tmp_path / "merged.csv"
+
+    with pytest.raises(FileNotFoundError):
+        merge_outputs([first], output, index_path=tmp_path / "nodir" / "keys.sqlite")
+
+    assert not output.exists()
+
+
+def test_merge_keeps_spec_specific_columns(tmp_path):
+    columns = ['profile_url', 'profile_name', 'occupation', 'connected_on']
+    first = tmp_path / "first.csv"
+    pd.DataFrame([("/in/a", "A", "Engineer", "Connected 1 week ago")], columns=columns).to_csv(first, index=False)
+    second = tmp_path / "second.csv"
+    pd.DataFrame([("/in/a/", "A again", "Manager", ""), ("/in/b", "B", "Designer", "")],
+                 columns=columns).to_csv(second, index=False)
+    output = tmp_path / "merged.csv"
+
+    merge_outputs([first, second], output)
+
+    merged = pd.read_csv(output, dtype=str, keep_default_na=False)
+    assert list(merged.columns) == columns
+    assert merged['occupation'].tolist() == ["Engineer", "Designer"]
+
+
+def test_merge_rejects_mismatched_columns(tmp_path):
+    first = write_csv(tmp_path / "first.csv", [("A", "/in/a", "Sent today", "Acme")])
+    second = tmp_path / "second.csv"
+    pd.DataFrame([("/in/b", "B", "Designer")], columns=['profile_url', 'profile_name', 'occupation']).to_csv(
+        second, index=False
+    )
+    output = tmp_path / "merged.csv"
+
+    with pytest.raises(ValueError):
+        merge_outputs([first, second], output)
+
+    assert not output.exists()
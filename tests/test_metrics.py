@@ -0,0 +1,37 @@
+import math
+import time
+
+import pytest
+
+from linkscraper.utils.metrics import Metric, render_metrics
+
+
+def test_render_metrics_prometheus_text_format():
+    text = render_metrics([
+        Metric("cards_seen_total", "counter", "Invitation cards parsed", 3),
+        Metric("last_new_card_age_seconds", "gauge", "Age", None),
+    ])
+
+    assert text.splitlines() == [
+        "# HELP linkscraper_cards_seen_total Invitation cards parsed",
+        "# TYPE linkscraper_cards_seen_total counter",
+        "linkscraper_cards_seen_total 3.0",
+        "# HELP linkscraper_last_new_card_age_seconds Age",
+        "# TYPE linkscraper_last_new_card_age_seconds gauge",
+        "linkscraper_last_new_card_age_seconds NaN",
+    ]
+
+
+def test_card_age_gauges_fall_back_to_run_start(tmp_path):
+    pytest.importorskip("playwright")
+    from linkscraper.config import ScraperConfig
+    from linkscraper.scrapers.linkedin_invitations import LinkedInInvitationsScraper
+
+    scraper = LinkedInInvitationsScraper(ScraperConfig(logs_dir=tmp_path / "logs"))
+    scraper.run_started_at = time.monotonic() - 120
+    scraper.last_card_at = time.monotonic() - 5
+
+    metrics = {metric.name: metric.value for metric in scraper.collect_metrics()}
+
+    assert math.isclose(metrics["last_new_card_age_seconds"], 120, abs_tol=1)
+    assert math.isclose(metrics["last_card_age_seconds"], 5, abs_tol=1)
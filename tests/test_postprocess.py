@@ -0,0 +1,117 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from linkscraper.utils.postprocess import (
+    RESOLVED_DATE_COLUMN,
+    canonicalize_profile_urls,
+    normalize_invited_to,
+    postprocess_frame,
+    resolve_relative_dates,
+)
+
+RUN_TIMESTAMP = datetime(2024, 1, 15, 10, 30)
+
+
+def test_canonicalize_profile_urls():
+    urls = pd.Series([
+        "https://www.linkedin.com/in/JohnDoe/?miniProfileUrn=abc",
+        "/in/jane-x",
+        "https://uk.linkedin.com/in/bob#about",
+        "http://linkedin.com/in/bob/",
+        "https://www.linkedin.com/company/acme//",
+        "  ",
+        None,
+    ])
+
+    result = canonicalize_profile_urls(urls).tolist()
+
+    assert result[:5] == [
+        "https://www.linkedin.com/in/johndoe/",
+        "https://www.linkedin.com/in/jane-x/",
+        "https://www.linkedin.com/in/bob/",
+        "https://www.linkedin.com/in/bob/",
+        "https://www.linkedin.com/company/acme/",
+    ]
+    assert pd.isna(result[5])
+    assert pd.isna(result[6])
+
+
+def test_resolve_relative_dates():
+    dates = pd.Series([
+        "Sent today",
+        "Sent yesterday",
+        "Sent 3 weeks ago",
+        "Sent 2 days ago",
+        "Sent 5 hours ago",
+        "Sent 1 mo ago",
+        "Invited to follow Acme",
+        None,
+    ])
+
+    result = resolve_relative_dates(dates, RUN_TIMESTAMP)
+
+    assert result.iloc[0] == pd.Timestamp("2024-01-15")
+    assert result.iloc[1] == pd.Timestamp("2024-01-14")
+    assert result.iloc[2] == pd.Timestamp("2023-12-25")
+    assert result.iloc[3] == pd.Timestamp("2024-01-13")
+    assert result.iloc[4] == pd.Timestamp("2024-01-15")
+    assert result.iloc[5] == pd.Timestamp("2023-12-16")
+    assert pd.isna(result.iloc[6])
+    assert pd.isna(result.iloc[7])
+
+
+def test_normalize_invited_to():
+    values = pd.Series(["Invited  to follow\nTechCorp", "invited to follow:  Acme ", None])
+
+    assert normalize_invited_to(values).tolist() == [
+        "Invited to follow TechCorp",
+        "Invited to follow Acme",
+        "",
+    ]
+
+
+def test_postprocess_frame_formats_resolved_dates_as_iso_strings():
+    df = pd.DataFrame({
+        'profile_name': ["A", "B"],
+        'profile_url': ["/in/a", "/in/b"],
+        'invitation_date': ["Sent 3 weeks ago", "Sent on Monday"],
+        'invited_to': ["Invited to follow Acme", ""],
+    })
+
+    result = postprocess_frame(df, RUN_TIMESTAMP)
+
+    assert result[RESOLVED_DATE_COLUMN].iloc[0] == "2023-12-25"
+    assert pd.isna(result[RESOLVED_DATE_COLUMN].iloc[1])
+
+
+def test_save_results_twice_keeps_a_single_date_format(tmp_path):
+    pytest.importorskip("playwright")
+    pytest.importorskip("openpyxl")
+    from linkscraper.config import ScraperConfig
+    from linkscraper.scrapers.linkedin_invitations import InvitationEntry, LinkedInInvitationsScraper
+
+    config = ScraperConfig(
+        output_csv=tmp_path / "output.csv",
+        output_xlsx=tmp_path / "output.xlsx",
+        resume_state_file=tmp_path / "state.json",
+        logs_dir=tmp_path / "logs",
+    )
+
+    first = LinkedInInvitationsScraper(config)
+    first.logger.start_time = datetime(2024, 1, 15, 10, 30)
+    first.entries = [InvitationEntry("A", "/in/a", "Sent 3 weeks ago", "Invited to follow Acme")]
+    first._save_results()
+
+    second = LinkedInInvitationsScraper(config)
+    second.logger.start_time = datetime(2024, 2, 14, 9, 0)
+    second.entries = [InvitationEntry("B", "/in/b", "Sent today", "Invited to follow Acme")]
+    second._save_results()
+
+    csv_dates = pd.read_csv(config.output_csv, dtype=str)[RESOLVED_DATE_COLUMN].tolist()
+    assert csv_dates == ["2023-12-25", "2024-02-14"]
+
+    xlsx_dates = pd.read_excel(config.output_xlsx, dtype=object)[RESOLVED_DATE_COLUMN].tolist()
+    assert all(isinstance(value, str) for value in xlsx_dates)
+    assert xlsx_dates == ["2023-12-25", "2024-02-14"]
@@ -0,0 +1,93 @@
+import csv
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from linkscraper.utils.postprocess import OUTPUT_COLUMNS, postprocess_frame
+from linkscraper.utils.snapshot_diff import diff_snapshots, write_snapshot
+
+
+def make_frame(urls):
+    return postprocess_frame(
+        pd.DataFrame({
+            'profile_name': urls,
+            'profile_url': urls,
+            'invitation_date': "Sent today",
+            'invited_to': "Invited to follow Acme",
+        }),
+        datetime(2024, 1, 15),
+    )
+
+
+def read_diff(path):
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        return [(row['status'], row['profile_url']) for row in csv.DictReader(file)]
+
+
+def test_diff_reports_new_vanished_and_unchanged(tmp_path):
+    previous = tmp_path / "previous.csv"
+    current = tmp_path / "current.csv"
+    diff = tmp_path / "diff.csv"
+    write_snapshot(make_frame(["/in/a", "/in/b", "/in/c"]), previous)
+    write_snapshot(make_frame(["/in/d", "/in/B", "/in/c", "/in/c"]), current)
+
+    stats = diff_snapshots(previous, current, diff)
+
+    assert (stats.new, stats.vanished, stats.unchanged) == (1, 1, 2)
+    assert read_diff(diff) == [
+        ("vanished", "https://www.linkedin.com/in/a/"),
+        ("new", "https://www.linkedin.com/in/d/"),
+    ]
+
+
+def test_diff_without_previous_snapshot_marks_everything_new(tmp_path):
+    current = tmp_path / "current.csv"
+    write_snapshot(make_frame(["/in/a", "/in/b"]), current)
+
+    stats = diff_snapshots(None, current, tmp_path / "diff.csv")
+
+    assert (stats.new, stats.vanished, stats.unchanged) == (2, 0, 0)
+
+
+def test_empty_current_snapshot_marks_everything_vanished(tmp_path):
+    previous = tmp_path / "previous.csv"
+    current = tmp_path / "current.csv"
+    write_snapshot(make_frame(["/in/a", "/in/b"]), previous)
+    write_snapshot(pd.DataFrame(columns=OUTPUT_COLUMNS), current)
+
+    stats = diff_snapshots(previous, current, tmp_path / "diff.csv")
+
+    assert (stats.new, stats.vanished, stats.unchanged) == (0, 2, 0)
+
+
+def test_unsorted_snapshot_is_rejected(tmp_path):
+    previous = tmp_path / "previous.csv"
+    current = tmp_path / "current.csv"
+    make_frame(["/in/b", "/in/a"]).to_csv(previous, index=False)
+    write_snapshot(make_frame(["/in/a"]), current)
+
+    with pytest.raises(ValueError):
+        diff_snapshots(previous, current, tmp_path / "diff.csv")
+
+
+def test_run_without_cards_still_reports_vanished(tmp_path):
+    pytest.importorskip("playwright")
+    from linkscraper.config import ScraperConfig
+    from linkscraper.scrapers.linkedin_invitations import LinkedInInvitationsScraper
+
+    config = ScraperConfig(
+        output_csv=tmp_path / "output.csv",
+        output_xlsx=tmp_path / "output.xlsx",
+        resume_state_file=tmp_path / "state.json",
+        snapshot_file=tmp_path / "snapshot.csv",
+        logs_dir=tmp_path / "logs",
+    )
+    write_snapshot(make_frame(["/in/a", "/in/b"]), config.snapshot_file)
+
+    scraper = LinkedInInvitationsScraper(config)
+    scraper._write_run_diff()
+
+    assert scraper.logger.diff_counts == (0, 2, 0)
+    assert [status for status, _ in read_diff(config.diff_csv)] == ["vanished", "vanished"]
+    assert pd.read_csv(config.snapshot_file).empty